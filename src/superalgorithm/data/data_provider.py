@@ -1,6 +1,8 @@
 import asyncio
-from typing import Dict
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple
 from superalgorithm.data.data_source import DataSource
+from superalgorithm.types.data_types import Bar
 
 
 class DataProvider:
@@ -25,11 +27,39 @@ class DataProvider:
         async for bar, is_live in func():
             await queue.put([bar, is_live])
 
-    async def stream_data(self):
-
+    async def connect(self):
         tasks = [source.connect() for source in self.data_sources.values()]
         await asyncio.gather(*tasks, return_exceptions=True)
 
+    def iter_data(self) -> Optional[Iterator[Tuple[Bar, bool]]]:
+        """
+        Synchronous alternative to `stream_data` used for backtests, returns None unless every data source supports `iter_data`.
+
+        Bars are read from the data sources in turn, without the queue and producer tasks. Call `connect` before consuming the iterator.
+        """
+        readers = [source.iter_data() for source in self.data_sources.values()]
+        if not readers or any(reader is None for reader in readers):
+            return None
+        return self._round_robin(readers)
+
+    def _round_robin(self, readers: List[Iterator[Tuple[Bar, bool]]]):
+        readers = deque(readers)
+        while readers:
+            reader = readers.popleft()
+            item = next(reader, None)
+            if item is None:
+                continue
+            readers.append(reader)
+
+            bar, is_live = item
+            if bar is not None:
+                self.data_sources_is_live[bar.source_id] = is_live
+            yield bar, all(self.data_sources_is_live.values())
+
+    async def stream_data(self):
+
+        await self.connect()
+
         queue = asyncio.Queue()
 
         producers = [
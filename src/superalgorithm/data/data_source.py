@@ -1,4 +1,4 @@
-from typing import List, Dict, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
 from abc import ABC, abstractmethod
 from superalgorithm.data.ohlcv_aggregator import OHLCVAggregator
 from superalgorithm.types.data_types import OHLCV, AggregatorResult, Bar
@@ -75,6 +75,16 @@ class DataSource(ABC):
         """
         pass
 
+    def iter_data(self) -> Optional[Iterator[Tuple[Bar, bool]]]:
+        """
+        Optional synchronous counterpart of `read` for historical data sources.
+
+        Data sources that already hold all of their data in memory after `connect` (i.e. CSV backtests) can return a plain iterator
+        yielding the same `(Bar, bool)` tuples as `read`, which lets paper trading consume bars without going through the event loop.
+        The default returns None, meaning the data source only supports `read`.
+        """
+        return None
+
     @abstractmethod
     async def disconnect(self):
         """
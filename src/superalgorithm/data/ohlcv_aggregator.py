@@ -85,11 +85,16 @@ class OHLCVAggregator(EventEmitter):
                 new_bucket_started = True
 
         else:
-            # just update the values
-            self.current_bar.high = max(self.current_bar.high, data.high)
-            self.current_bar.low = min(self.current_bar.low, data.low)
-            self.current_bar.close = data.close
-            self.current_bar.volume += data.volume
+            # OHLCV is frozen, build the updated bar from the current one
+            current_bar = self.current_bar
+            self.current_bar = OHLCV(
+                timestamp=current_bar.timestamp,
+                open=current_bar.open,
+                high=max(current_bar.high, data.high),
+                low=min(current_bar.low, data.low),
+                close=data.close,
+                volume=current_bar.volume + data.volume,
+            )
 
         return AggregatorResult(
             current_bar=self.current_bar,
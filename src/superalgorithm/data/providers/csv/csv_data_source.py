@@ -1,4 +1,5 @@
 import asyncio
+from collections import deque
 from typing import List
 from superalgorithm.data.data_provider import DataSource
 from superalgorithm.data.providers.csv import load_historical_data
@@ -27,9 +28,12 @@ class CSVDataSource(DataSource):
         if self.since_ts > 0:
             self.data = [item for item in self.data if item.timestamp > self.since_ts]
 
-    async def read(self):
-        while True and len(self.data) > 0:
-            ohlcv = self.data.pop(0)
+        # read() consumes the bars from the front, a deque makes this O(1) instead of list.pop(0) shifting the whole list
+        self.data = deque(self.data)
+
+    def _iter_bars(self):
+        while len(self.data) > 0:
+            ohlcv = self.data.popleft()
             yield Bar(
                 ohlcv.timestamp,
                 self.source_id,
@@ -40,7 +44,13 @@ class CSVDataSource(DataSource):
             if len(self.data) == 0:
                 yield None, False
 
+    async def read(self):
+        for item in self._iter_bars():
+            yield item
             await asyncio.sleep(0)
 
+    def iter_data(self):
+        return self._iter_bars()
+
     async def disconnect(self):
         pass
@@ -1,5 +1,5 @@
 import asyncio
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set
 import ccxt.pro as ccxt
 from ccxt import Exchange
 from ccxt import OperationFailed, OrderNotFound, RateLimitExceeded
@@ -33,6 +33,9 @@ class CCXTExchange(BaseExchange):
         self.trade_queue = asyncio.Queue()
         self.order_queue = asyncio.Queue()
 
+        # pending retries of unmatched trades, referenced here so they aren't garbage collected and can be cancelled in stop()
+        self._retry_tasks: Set[asyncio.Task] = set()
+
         self.register_task(self.sync_trades)
         self.register_task(self.process_trades)
         self.register_task(self.sync_orders)
@@ -78,7 +81,22 @@ class CCXTExchange(BaseExchange):
     async def process_trades(self):
         while True:
             trade_json = await self.trade_queue.get()
-            await self.trade_manager.add(self._json_to_trade_obj(trade_json))
+            trade = self._json_to_trade_obj(trade_json)
+            # only unmatched trades need the (sleeping) retry, everything else is handled without awaiting
+            if self.trade_manager.try_add(trade):
+                task = asyncio.create_task(
+                    self.trade_manager.retry_trade_matching(trade)
+                )
+                self._retry_tasks.add(task)
+                task.add_done_callback(self._retry_tasks.discard)
+
+    async def stop(self):
+        for task in self._retry_tasks:
+            task.cancel()
+        await asyncio.gather(*self._retry_tasks, return_exceptions=True)
+        self._retry_tasks.clear()
+
+        await super().stop()
 
     async def sync_orders(self):
         """
@@ -291,11 +309,6 @@ class CCXTExchange(BaseExchange):
 
             if currency not in ["free", "used", "total", "debt", "info"]:
 
-                response.free[currency] = data.get("free", 0)
-                response.used[currency] = data.get("used", 0)
-                response.total[currency] = data.get("total", 0)
-                response.debt[currency] = data.get("debt", 0)
-
                 response.currencies[currency] = BalanceData(
                     data.get("free", 0),
                     data.get("used", 0),
@@ -24,15 +24,17 @@ class OrderManager:
         self, client_order_id: int, filled: float, order_status: OrderStatus
     ):
         order = self.orders[client_order_id]
-        order.filled = filled
 
-        order_modified = order.order_status != order_status or order.filled != filled
+        fill_changed = order.filled != filled
+        if fill_changed:
+            order.filled = filled
 
-        if order.order_status != order_status:
+        status_changed = order.order_status != order_status
+        if status_changed:
             order.order_status = order_status
             order.dispatch(order.order_status.value, order)
 
-        if order_modified:
+        if fill_changed or status_changed:
             log_order(order, stdout=False)
 
     def get_order_by_server_id(self, server_order_id: str):
@@ -10,6 +10,8 @@ class PositionManager:
     def __init__(self, exchange: BaseExchange):
         self.exchange = exchange
         self.positions: PositionDict = {}
+        # index of all LONG positions, used by exchanges to compute balances without walking all pairs
+        self.long_positions: List[Position] = []
 
     def get_or_create_position(
         self, pair: str, position_type: PositionType
@@ -20,7 +22,10 @@ class PositionManager:
         if pair not in self.positions:
             self.positions[pair] = {}
         if position_type not in self.positions[pair]:
-            self.positions[pair][position_type] = Position(pair, position_type)
+            position = Position(pair, position_type)
+            self.positions[pair][position_type] = position
+            if position_type == PositionType.LONG:
+                self.long_positions.append(position)
             log_message(f"created new position for {pair} {position_type}", "INFO")
         return self.positions[pair][position_type]
 
@@ -31,17 +36,28 @@ class PositionManager:
 
     # todo: re-evaluatie this method need
     def list_trades(
-        self, trade_type: TradeType = None, position_type: PositionType = None
+        self,
+        trade_type: TradeType = None,
+        position_type: PositionType = None,
+        pair: str = None,
     ) -> List[Trade]:
         """
-        Retrieves all trades with optional filtering by trade type and position type.
+        Retrieves all trades with optional filtering by trade type, position type and pair.
+        Filtering by pair only visits the positions of that pair instead of scanning all trades.
         """
         if not self.positions:
             return []
 
+        if pair is None:
+            pair_positions_list = self.positions.values()
+        elif pair in self.positions:
+            pair_positions_list = [self.positions[pair]]
+        else:
+            return []
+
         return [
             trade
-            for pair_positions in self.positions.values()
+            for pair_positions in pair_positions_list
             for position in pair_positions.values()
             if position_type is None or position.position_type == position_type
             for trade in position.trades
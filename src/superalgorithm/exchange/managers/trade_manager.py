@@ -27,13 +27,20 @@ class TradeManager:
 
         return False
 
-    async def add(self, trade: Trade):
+    def try_add(self, trade: Trade) -> bool:
+        """
+        Synchronously registers and matches the trade. Returns True only if the trade could not be matched yet and a retry is required.
+        Already processed trades return False right away, so replayed trade history never creates a coroutine.
+        """
         if trade.trade_id in self.processed_trades:
-            return
+            return False
 
         self.processed_trades.add(trade.trade_id)
 
-        if not self.trade_matching(trade):
+        return not self.trade_matching(trade)
+
+    async def add(self, trade: Trade):
+        if self.try_add(trade):
             await self.retry_trade_matching(trade)
 
     async def retry_trade_matching(self, trade: Trade):
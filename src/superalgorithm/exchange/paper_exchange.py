@@ -1,5 +1,6 @@
 import asyncio
-from typing import Dict
+from collections import deque
+from typing import Deque, Dict
 import uuid
 import warnings
 from superalgorithm.exchange.status_tracker import (
@@ -15,19 +16,27 @@ from superalgorithm.types.data_types import (
     Trade,
     PositionType,
     TradeType,
-    Position,
 )
 from superalgorithm.exchange.base_exchange import BaseExchange, InsufficientFundsError
 from superalgorithm.utils.logging import log_message
 from superalgorithm.exchange.status_tracker import get_latest_price
 
+# cash delta per (trade type, position type), called with (price, quantity, pnl)
+# opening a short does not change the cash balance, it's only settled with the pnl when closing
+_CASH_DELTA = {
+    (TradeType.OPEN, PositionType.LONG): lambda price, quantity, pnl: -price * quantity,
+    (TradeType.CLOSE, PositionType.LONG): lambda price, quantity, pnl: price * quantity,
+    (TradeType.OPEN, PositionType.SHORT): lambda price, quantity, pnl: 0,
+    (TradeType.CLOSE, PositionType.SHORT): lambda price, quantity, pnl: pnl,
+}
+
 
 class PaperExchange(BaseExchange):
     def __init__(self, initial_cash: int = 10000):
         super().__init__()
         self.initial_cash = initial_cash  # required by backtest analytics
         self.cash = initial_cash  # cash balance of the paper account
-        self.trade_tasks = []
+        self.trade_tasks: Deque[asyncio.Task] = deque()
 
     async def _simulate_trade_execution(self, trade_response_json: Dict):
         """
@@ -56,7 +65,8 @@ class PaperExchange(BaseExchange):
             server_order_id=trade_response_json.get("server_order_id"),
         )
 
-        await self.trade_manager.add(trade)
+        # the associated order is known, so match the trade right away instead of going through the async trade_manager.add()
+        self.trade_manager.try_add(trade)
 
         self._update_cash(trade)
 
@@ -172,47 +182,25 @@ class PaperExchange(BaseExchange):
 
     def _update_cash(self, trade: Trade):
         """
-        This method updates the paper trade cash balance after a trade was executed
-        """
-
-        associated_order = self.order_manager.get_order_by_server_id(
-            trade.server_order_id
-        )
-
-        # based on the trade, find the position against which we traded
-        position: Position = self.position_manager.positions[associated_order.pair][
-            associated_order.position_type
-        ]
-
-        # get the trade from our Position, which now contains the computed pnl for that trade
-        updated_trade = position.get_trade(trade_id=trade.trade_id)
+        This method updates the paper trade cash balance after a trade was executed.
 
-        trade_type = updated_trade.trade_type
-        position_type = associated_order.position_type
-        price = updated_trade.price
-        quantity = updated_trade.quantity
-        pnl = updated_trade.pnl
+        The trade must have been matched already: trade_manager fills in trade_type and position_type from the order,
+        and Position.add_trade stores the computed pnl on the same Trade object, so no order or position lookup is required.
+        """
 
         # compute the new cash balance based on the trade and position type (close long, open short etc.)
-        if trade_type == TradeType.OPEN and position_type == PositionType.LONG:
-            self.cash -= price * quantity
-        elif trade_type == TradeType.CLOSE and position_type == PositionType.LONG:
-            self.cash += price * quantity
-        elif trade_type == TradeType.CLOSE and position_type == PositionType.SHORT:
-            self.cash += pnl
+        self.cash += _CASH_DELTA[(trade.trade_type, trade.position_type)](
+            trade.price, trade.quantity, trade.pnl
+        )
 
     async def _get_balances(self) -> Balances:
         balances = Balances()
-        balances.free["USD"] = self.cash
+        balances.currencies["USD"] = BalanceData(self.cash, 0, self.cash, 0)
 
-        for pair in self.position_manager.positions:
-            for position in self.position_manager.positions[pair].values():
-                if position.position_type == PositionType.LONG:
-                    balances.free[position.pair] = position.balance
-
-                balances.currencies[pair] = BalanceData(
-                    position.balance, 0, position.balance, 0
-                )
+        for position in self.position_manager.long_positions:
+            balances.currencies[position.pair] = BalanceData(
+                position.balance, 0, position.balance, 0
+            )
 
         return balances
 
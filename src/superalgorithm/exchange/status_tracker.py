@@ -1,33 +1,57 @@
-from typing import Dict, Tuple
+from array import array
+from typing import Dict
 from superalgorithm.types.data_types import MarkPrice
 from superalgorithm.utils.helpers import get_now_ts
 
 
 class StatusTracker:
     def __init__(self):
-        self._last_seen_price: Dict[Tuple[str, str], MarkPrice] = {}
+        # pairs are interned to a small int index, timestamps and prices are stored in two parallel typed arrays
+        # array.array is used over numpy as all access is one scalar at a time, where it avoids numpy's scalar boxing
+        self._pair_idx: Dict[str, int] = {}
+        self._ts = array("q")
+        self._px = array("d")
         self._highest_timestamp = 0
 
+    def _intern_pair(self, pair: str) -> int:
+        """
+        Assigns the next free index to a pair seen for the first time and adds its slots to the price table.
+        """
+        idx = len(self._ts)
+        self._ts.append(0)
+        self._px.append(0.0)
+        self._pair_idx[pair] = idx
+        return idx
+
     def update_price(self, pair: str, timestamp: int, mark_price: float):
         """
         Updates the price data for a given pair. If the timestamp is higher than the last seen timestamp for the pair, the price data is updated.
         """
-        key = pair
-        if (
-            key not in self._last_seen_price
-            or timestamp > self._last_seen_price[key].timestamp
-        ):
-            self._last_seen_price[key] = MarkPrice(timestamp, mark_price)
-            self._highest_timestamp = max(self._highest_timestamp, timestamp)
+        # the typed columns only take int timestamps and float prices, i.e. a timestamp from time.time() * 1000 is truncated to ms
+        if mark_price is None:
+            raise ValueError(f"Mark price for pair {pair} can't be None")
+        timestamp = int(timestamp)
+        mark_price = float(mark_price)
+
+        idx = self._pair_idx.get(pair)
+        if idx is None:
+            idx = self._intern_pair(pair)
+        elif timestamp <= self._ts[idx]:
+            return
+
+        self._ts[idx] = timestamp
+        self._px[idx] = mark_price
+        if timestamp > self._highest_timestamp:
+            self._highest_timestamp = timestamp
 
     def get_latest_price(self, pair: str) -> MarkPrice:
         """
         Used by paper trading to get the latest price data for a given pair.
         IMPORTANT: Don't use this for live trading.
         """
-        key = pair
-        if key in self._last_seen_price:
-            return self._last_seen_price[key]
+        idx = self._pair_idx.get(pair)
+        if idx is not None:
+            return MarkPrice(self._ts[idx], self._px[idx])
         raise ValueError(f"No price data available for pair {pair}")
 
     def get_highest_timestamp(self) -> int:
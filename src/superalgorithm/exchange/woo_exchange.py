@@ -1,6 +1,6 @@
 from typing import Any
 from superalgorithm.exchange.ccxt_exchange import CCXTExchange
-from superalgorithm.types.data_types import Order
+from superalgorithm.types.data_types import Order, PositionType
 
 
 class WOOExchange(CCXTExchange):
@@ -9,13 +9,19 @@ class WOOExchange(CCXTExchange):
 
         self.hedge_mode = config.get("hedge_mode", False)
 
+        # the position_side param only depends on hedge_mode and the position type, so we compute it once
+        self._param_template = {
+            position_type: (
+                {"position_side": position_type.value} if self.hedge_mode else {}
+            )
+            for position_type in PositionType
+        }
+
     def _create_order_params(self, order: Order) -> dict:
-        params = {
+        return {
             "client_order_id": order.client_order_id,
+            **self._param_template[order.position_type],
         }
-        if self.hedge_mode:
-            params["position_side"] = order.position_type.value
-        return params
 
     async def _create_limit_order(self, order: Order) -> str:
         return await super()._create_limit_order(
@@ -1,5 +1,6 @@
 from abc import abstractmethod
 import asyncio
+from collections import deque
 from typing import List
 import warnings
 from superalgorithm.data.data_provider import DataProvider
@@ -24,6 +25,10 @@ from superalgorithm.exchange.status_tracker import (
 )
 
 
+# the synchronous backtest loop yields to the event loop once per this many bars
+PAPER_YIELD_INTERVAL = 100
+
+
 class BaseStrategy(EventEmitter):
     def __init__(self, data_sources: list[DataSource], exchange: BaseExchange):
         super().__init__()
@@ -40,7 +45,8 @@ class BaseStrategy(EventEmitter):
         )
         log_message(f"Mode set to {self.mode}")
 
-        [self.data_provider.add_data_source(ds) for ds in data_sources]
+        for ds in data_sources:
+            self.data_provider.add_data_source(ds)
 
     @abstractmethod
     def init(self):
@@ -156,8 +162,12 @@ class BaseStrategy(EventEmitter):
         We will wait until all of them are processed. This works because the paper exchange at this time executes any order instantly.
         TODO: if we implement limit order for paper trading we have to update this logic.
         """
-        tasks_to_process = list(self.exchange.trade_tasks)
-        self.exchange.trade_tasks.clear()
+        if not self.exchange.trade_tasks:
+            return
+
+        # swap in a new deque, trades created while we wait are processed on the next bar
+        tasks_to_process = self.exchange.trade_tasks
+        self.exchange.trade_tasks = deque()
         await asyncio.gather(*tasks_to_process, return_exceptions=True)
 
     def _switch_to_live_mode(self):
@@ -177,20 +187,44 @@ class BaseStrategy(EventEmitter):
             await strategy_monitor.start()
             # self._async_tasks.append(strategy_monitor.start())
 
+        # the mode only changes once from PRELOAD to LIVE, so we evaluate it outside of the per bar loop
+        is_paper = self.mode == ExecutionMode.PAPER
+        is_preload = self.mode == ExecutionMode.PRELOAD
+        process_bar = self._process_bar
+        process_paper_trades = self._process_paper_trades
+
+        # backtests over in-memory data sources are read synchronously, skipping the queue and producer tasks of stream_data
+        bars = self.data_provider.iter_data() if is_paper else None
+        if bars is not None:
+            await self.data_provider.connect()
+            for bar_count, (bar, _) in enumerate(bars, 1):
+                if bar is None:
+                    self.dispatch("backtest_done", self)
+                    break
+
+                await process_bar(bar)
+                await process_paper_trades()
+
+                # bars without paper trades never suspend, so yield now and then to let background tasks run
+                if bar_count % PAPER_YIELD_INTERVAL == 0:
+                    await asyncio.sleep(0)
+            return
+
         async for bar, is_live in self.data_provider.stream_data():
 
-            if self.mode == ExecutionMode.PAPER and bar is None:
+            if is_paper and bar is None:
                 self.dispatch("backtest_done", self)
                 break  # break the event loop
 
-            if self.mode == ExecutionMode.PRELOAD and is_live:
+            if is_preload and is_live:
                 self._switch_to_live_mode()
+                is_preload = False
 
-            await self._process_bar(bar)
+            await process_bar(bar)
 
             # during paper trading, we wait for trades to fill orders
-            if self.mode == ExecutionMode.PAPER:
-                await self._process_paper_trades()
+            if is_paper:
+                await process_paper_trades()
             else:
                 await asyncio.sleep(0)
 
@@ -199,8 +233,10 @@ class BaseStrategy(EventEmitter):
         await self.exchange.stop()
         await strategy_monitor.stop()
 
-        # finish any remaining tasks
-        tasks = [task for task in asyncio.all_tasks()]
+        # cancel any remaining tasks (except the one running stop) and wait for them to unwind
+        tasks = asyncio.all_tasks() - {asyncio.current_task()}
+        for task in tasks:
+            task.cancel()
         await asyncio.gather(*tasks, return_exceptions=True)
 
     def data(self, source_id: str, timeframe: str) -> List[OHLCV]:
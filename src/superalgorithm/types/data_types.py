@@ -1,8 +1,10 @@
 from __future__ import annotations
-from dataclasses import dataclass, field, asdict
+import asyncio
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 import json
+import time
 from typing import Any, Dict, List, Optional, Union
 from superalgorithm.utils.unique_int_generator import unique_int_generator
 from superalgorithm.utils.event_emitter import EventEmitter
@@ -57,13 +59,18 @@ class OrderType(Enum):
 
 @dataclass
 class AggregatorResult:
+    __slots__ = ("current_bar", "is_new_bar_started", "last_completed_bar")
+
     current_bar: OHLCV
     is_new_bar_started: bool
     last_completed_bar: Optional[OHLCV]
 
 
-@dataclass
+@dataclass(frozen=True)
 class OHLCV:
+    # immutable, updates create a new instance. explicit __slots__ instead of dataclass(slots=True), which needs python 3.10+
+    __slots__ = ("timestamp", "open", "high", "low", "close", "volume")
+
     timestamp: int
     open: float
     high: float
@@ -71,14 +78,38 @@ class OHLCV:
     close: float
     volume: float
 
+    # frozen + __slots__ has no __dict__ for copy/pickle to fill and setattr raises, restore fields like dataclass(slots=True) does
+    def __getstate__(self):
+        return [getattr(self, name) for name in self.__slots__]
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
 
 @dataclass
 class MarkPrice:
+    __slots__ = ("timestamp", "mark")
+
     timestamp: int
     mark: float
 
 
 class Order(EventEmitter):
+    __slots__ = (
+        "pair",
+        "position_type",
+        "trade_type",
+        "quantity",
+        "price",
+        "order_type",
+        "order_status",
+        "client_order_id",
+        "server_order_id",
+        "timestamp",
+        "filled",
+        "_closed",
+    )
 
     def __init__(
         self,
@@ -104,23 +135,25 @@ class Order(EventEmitter):
         self.order_status = order_status
         self.client_order_id = client_order_id or self.generate_client_id()
         self.server_order_id = server_order_id
-        self.timestamp = timestamp or int(datetime.now().timestamp())
+        self.timestamp = timestamp or int(time.time())
         self.filled = filled
+        # future resolved with the order once it is CLOSED, only created when the order is awaited
+        self._closed: Optional[asyncio.Future] = None
 
     def to_dict(self):
-        data_dict = {}
-        data_dict["pair"] = self.pair
-        data_dict["position_type"] = self.position_type.value
-        data_dict["price"] = self.price
-        data_dict["trade_type"] = self.trade_type.value
-        data_dict["quantity"] = self.quantity
-        data_dict["order_type"] = self.order_type.value
-        data_dict["order_status"] = self.order_status.value
-        data_dict["client_order_id"] = self.client_order_id
-        data_dict["server_order_id"] = self.server_order_id
-        data_dict["timestamp"] = self.timestamp
-        data_dict["filled"] = self.filled
-        return data_dict
+        return {
+            "pair": self.pair,
+            "position_type": self.position_type.value,
+            "price": self.price,
+            "trade_type": self.trade_type.value,
+            "quantity": self.quantity,
+            "order_type": self.order_type.value,
+            "order_status": self.order_status.value,
+            "client_order_id": self.client_order_id,
+            "server_order_id": self.server_order_id,
+            "timestamp": self.timestamp,
+            "filled": self.filled,
+        }
 
     def to_json(self):
         return json.dumps(self.to_dict(), indent=4)
@@ -129,24 +162,94 @@ class Order(EventEmitter):
     def generate_client_id() -> int:
         return unique_int_generator.generate_client_id()
 
+    def closed(self) -> asyncio.Future:
+        """
+        Returns a future resolved with the order once it reaches a final status (CLOSED, REJECTED, CANCELED or EXPIRED), the same future is returned on every call.
+        Check order.order_status to tell a filled order from the others.
+        """
+        if self._closed is None:
+            self._closed = asyncio.get_running_loop().create_future()
+            if self.order_status != OrderStatus.OPEN:
+                self._closed.set_result(self)
+            else:
+                for order_status in OrderStatus:
+                    if order_status != OrderStatus.OPEN:
+                        self.on(order_status.value, self._set_closed)
+        return self._closed
+
+    def _set_closed(self, order: Order):
+        if not self._closed.done():
+            self._closed.set_result(self)
+
+    def __await__(self):
+        """
+        Awaiting an order waits until it is CLOSED (filled), REJECTED, CANCELED or EXPIRED and returns the order, i.e. order = await (await exchange.open(...))
+        Same as awaiting order.closed().
+        """
+        return self.closed().__await__()
+
 
-@dataclass
 class Trade:
-    trade_id: str
-    timestamp: int
-    pair: str
-    position_type: PositionType
-    trade_type: TradeType
-    price: float
-    quantity: float
-    server_order_id: str
-    pnl: int = 0
+    # written out like Order instead of a dataclass, manual __slots__ can't be combined with the pnl field default
+    __slots__ = (
+        "trade_id",
+        "timestamp",
+        "pair",
+        "position_type",
+        "trade_type",
+        "price",
+        "quantity",
+        "server_order_id",
+        "pnl",
+    )
+
+    def __init__(
+        self,
+        trade_id: str,
+        timestamp: int,
+        pair: str,
+        position_type: PositionType,
+        trade_type: TradeType,
+        price: float,
+        quantity: float,
+        server_order_id: str,
+        pnl: int = 0,
+    ):
+        self.trade_id = trade_id
+        self.timestamp = timestamp
+        self.pair = pair
+        self.position_type = position_type
+        self.trade_type = trade_type
+        self.price = price
+        self.quantity = quantity
+        self.server_order_id = server_order_id
+        self.pnl = pnl
+
+    def _astuple(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"Trade({fields})"
 
     def to_dict(self):
-        data_dict = asdict(self)
-        data_dict["position_type"] = self.position_type.value
-        data_dict["trade_type"] = self.trade_type.value
-        return data_dict
+        # built by hand, dataclasses.asdict recursively deep-copies every field
+        return {
+            "trade_id": self.trade_id,
+            "timestamp": self.timestamp,
+            "pair": self.pair,
+            "position_type": self.position_type.value,
+            "trade_type": self.trade_type.value,
+            "price": self.price,
+            "quantity": self.quantity,
+            "server_order_id": self.server_order_id,
+            "pnl": self.pnl,
+        }
 
     def to_json(self):
         return json.dumps(self.to_dict(), indent=4)
@@ -154,34 +257,37 @@ class Trade:
 
 @dataclass
 class Bar:
+    __slots__ = (
+        "timestamp",
+        "source_id",
+        "timeframe",
+        "ohlcv",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+    )
+
     timestamp: int
     source_id: str
     timeframe: str
     ohlcv: OHLCV
 
-    @property
-    def open(self) -> float:
-        return self.ohlcv.open
-
-    @property
-    def high(self) -> float:
-        return self.ohlcv.high
-
-    @property
-    def low(self) -> float:
-        return self.ohlcv.low
-
-    @property
-    def close(self) -> float:
-        return self.ohlcv.close
-
-    @property
-    def volume(self) -> float:
-        return self.ohlcv.volume
+    def __post_init__(self):
+        # copied once so per tick reads of bar.close etc. are plain attribute reads, bars are never mutated after creation
+        ohlcv = self.ohlcv
+        self.open: float = ohlcv.open
+        self.high: float = ohlcv.high
+        self.low: float = ohlcv.low
+        self.close: float = ohlcv.close
+        self.volume: float = ohlcv.volume
 
 
 @dataclass
 class BalanceData:
+    __slots__ = ("free", "used", "total", "debt")
+
     free: float
     used: float
     total: float
@@ -190,13 +296,25 @@ class BalanceData:
 
 @dataclass
 class Balances:
-    free: Dict[str, float] = field(default_factory=dict)
-    used: Dict[str, float] = field(default_factory=dict)
-    total: Dict[str, float] = field(default_factory=dict)
-    debt: Dict[str, float] = field(default_factory=dict)
-
+    # currencies is the only stored data, free/used/total/debt are per currency views built on access
     currencies: Dict[str, BalanceData] = field(default_factory=dict)
 
+    @property
+    def free(self) -> Dict[str, float]:
+        return {currency: data.free for currency, data in self.currencies.items()}
+
+    @property
+    def used(self) -> Dict[str, float]:
+        return {currency: data.used for currency, data in self.currencies.items()}
+
+    @property
+    def total(self) -> Dict[str, float]:
+        return {currency: data.total for currency, data in self.currencies.items()}
+
+    @property
+    def debt(self) -> Dict[str, float]:
+        return {currency: data.debt for currency, data in self.currencies.items()}
+
 
 @dataclass
 class MonitoringPoint:
@@ -244,6 +362,13 @@ class AnnotationPoint:
     message: str
     timestamp: int = 0
 
+    def to_dict(self):
+        return {
+            "value": self.value,
+            "message": self.message,
+            "timestamp": self.timestamp,
+        }
+
 
 @dataclass
 class LogMessagePoint:
@@ -252,31 +377,59 @@ class LogMessagePoint:
     level: str
     timestamp: int = 0
 
+    def to_dict(self):
+        return {
+            "message": self.message,
+            "stracktrace": self.stracktrace,
+            "level": self.level,
+            "timestamp": self.timestamp,
+        }
+
 
 class Position:
+    # "timestamp" is assigned by StrategyMonitor when a position is logged
+    __slots__ = (
+        "pair",
+        "position_type",
+        "_direction",
+        "trades",
+        "_trade_index",
+        "balance",
+        "average_open",
+        "_total_pnl",
+        "_traded_quantity",
+        "timestamp",
+    )
+
     def __init__(self, pair: str, position_type: PositionType):
         self.pair = pair
         self.position_type = position_type
+        # +1 for LONG, -1 for SHORT, resolved once so the pnl calculation doesn't compare enums per trade
+        self._direction = 1 if position_type == PositionType.LONG else -1
         self.trades: List[Trade] = []
+        self._trade_index: Dict[str, Trade] = {}
         self.balance: float = 0
         self.average_open: float = 0
+        # running aggregates, updated in add_trade so total_pnl and tradedQuantity don't rescan self.trades
+        self._total_pnl: float = 0
+        self._traded_quantity: float = 0
 
     def _calculate_pnl(self, quantity: float, close_price: float):
         # Adjust PNL calculation for long and short positions
-        if self.position_type == PositionType.LONG:
-            pnl = (close_price - self.average_open) * quantity
-        else:
-            pnl = (self.average_open - close_price) * quantity
-        return pnl
+        return (close_price - self.average_open) * quantity * self._direction
 
     def add_trade(self, trade: Trade):
 
         self.trades.append(trade)
+        # keep the first trade for an id, like the linear scan get_trade used to do
+        self._trade_index.setdefault(trade.trade_id, trade)
 
         if trade.trade_type == TradeType.OPEN:
             self.update_average_open(self.balance, trade.quantity, trade.price)
             self.balance += trade.quantity
 
+            self._traded_quantity += trade.quantity
+
         else:
             if trade.quantity > self.balance:
                 raise ValueError("Closing quantity exceeds current balance")
@@ -285,6 +438,7 @@ class Position:
             pnl = self._calculate_pnl(trade.quantity, trade.price)
 
             trade.pnl = pnl
+            self._total_pnl += pnl
 
         if self.balance == 0:
             self.average_open = 0  # Reset average when position is fully closed
@@ -298,10 +452,8 @@ class Position:
             self.average_open = total_value / new_total_quantity
 
     def get_trade(self, trade_id):
-        for trade in self.trades:
-            if trade.trade_id == trade_id:
-                return trade
-        return None  # Return None if no trade is found with the given trade_id
+        # Return None if no trade is found with the given trade_id
+        return self._trade_index.get(trade_id)
 
     def to_dict(self):
         data_dict = {}
@@ -317,31 +469,26 @@ class Position:
 
     @property
     def createdAt(self):
-        open_trades = [
-            trade.timestamp
-            for trade in self.trades
-            if trade.trade_type == TradeType.OPEN
-        ]
-        if open_trades:
-            return min(open_trades)
+        # read from the trades on access, logging a trade sets its timestamp after it was added to the position
+        created_at = min(
+            (
+                trade.timestamp
+                for trade in self.trades
+                if trade.trade_type == TradeType.OPEN
+            ),
+            default=None,
+        )
+        if created_at is not None:
+            return created_at
         return get_now_ts()
 
     @property
     def tradedQuantity(self):
-        open_trades = [
-            trade.quantity
-            for trade in self.trades
-            if trade.trade_type == TradeType.OPEN
-        ]
-        if open_trades:
-            return sum(open_trades)
-        return 0
+        return self._traded_quantity
 
     @property
     def total_pnl(self):
-        return sum(
-            trades.pnl for trades in self.trades if trades.trade_type == TradeType.CLOSE
-        )
+        return self._total_pnl
 
     def __repr__(self):
         return (
@@ -1,17 +1,26 @@
+from functools import lru_cache
 import requests
 import hmac
 import hashlib
 from superalgorithm.utils.config import config
 from superalgorithm.utils.helpers import get_now_ts, guid
 
+# reuse connections (TCP/TLS) across api calls
+_session = requests.Session()
+
+
+@lru_cache(maxsize=4)
+def _hmac_template(secret):
+    """
+    HMAC object initialized with the secret key, copied for every signature to skip the key setup.
+    """
+    return hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+
 
 def _sign_request(secret, nonce, timestamp):
-    message = f"{nonce}:{timestamp}"
-    return hmac.new(
-        secret.encode("utf-8"),
-        message.encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
+    signature = _hmac_template(secret).copy()
+    signature.update(f"{nonce}:{timestamp}".encode("utf-8"))
+    return signature.hexdigest()
 
 
 def api_call(
@@ -42,7 +51,7 @@ def api_call(
 
     # when sending json data to the api we have to use the json attribute of the request.post method,
     # when uploading files, we sent data and files
-    response = requests.post(url, headers=headers, json=json, data=data, files=files)
+    response = _session.post(url, headers=headers, json=json, data=data, files=files)
 
     if response.status_code == 200:
         return response.json()
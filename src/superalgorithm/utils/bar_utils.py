@@ -1,26 +1,29 @@
-from collections import defaultdict
+from typing import Dict, List
 from superalgorithm.utils.helpers import get_bucket_size
 from superalgorithm.exchange.status_tracker import get_highest_timestamp
 
-timeframe_start = defaultdict(lambda: 0)
+# per timeframe: [bucket size in ms, interval of the current bar (0 until tracking starts)], one lookup per call
+_timeframe_state: Dict[str, List[int]] = {}
 
 
 def is_new_bar(timeframe: str) -> bool:
     """
     Check if a new bar has started for the given timeframe based on the current time.
     """
-    timeframe_ms = get_bucket_size(timeframe)
+    state = _timeframe_state.get(timeframe)
+    if state is None:
+        state = _timeframe_state[timeframe] = [get_bucket_size(timeframe), 0]
 
-    current_ts = get_highest_timestamp()
+    current_interval = get_highest_timestamp() // state[0]
 
-    current_interval = current_ts // timeframe_ms
+    # on the first call to is_new_bar the interval is 0, hence we set it to current_interval to start the tracking process.
+    # it stays 0 as long as no timestamp is known, so tracking starts with the first real one.
+    if state[1] == 0:
+        state[1] = current_interval
+        return False
 
-    # on the first call to is_new_bar intervals[timeframe] is 0, hence we set it to current_interval to start the tracking process.
-    if timeframe_start[timeframe] == 0:
-        timeframe_start[timeframe] = current_interval
-
-    if current_interval > timeframe_start[timeframe]:
-        timeframe_start[timeframe] = current_interval
+    if current_interval > state[1]:
+        state[1] = current_interval
         return True
 
     return False
@@ -3,6 +3,9 @@ from pathlib import Path
 import warnings
 import yaml
 
+# use the libyaml based loader when available, it's a lot faster than the pure python SafeLoader
+_YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def read_config(yaml_file=None):
     """
@@ -15,7 +18,7 @@ def read_config(yaml_file=None):
         if yaml_file and os.path.exists(yaml_file):
             with open(yaml_file, "r") as file:
                 try:
-                    config = yaml.safe_load(file)
+                    config = yaml.load(file, Loader=_YAMLLoader)
                 except yaml.YAMLError as e:
                     raise e
     except Exception as e:
@@ -1,39 +1,48 @@
 from abc import ABC
 import asyncio
-from typing import Any, Callable, Dict, List, TypeVar, Generic
+from typing import Any, Callable, Dict, List, Tuple, TypeVar, Generic
 
 T = TypeVar("T", bound=Callable[..., None])
 
 
 class EventEmitter(ABC, Generic[T]):
+    __slots__ = ("listeners",)
+
     def __init__(self):
-        self.listeners: Dict[str, List[T]] = {}
+        # each listener is stored together with a flag telling if it is a coroutine function, computed once in on()
+        self.listeners: Dict[str, List[Tuple[T, bool]]] = {}
 
     def dispatch(self, event: str, *args: Any, **kwargs: Any) -> None:
         """
         Dispatch an event to all listeners. Async listeners are dispatched as tasks.
         """
-        if event in self.listeners:
-            for listener in self.listeners[event]:
-                if asyncio.iscoroutinefunction(listener):
-                    asyncio.create_task(listener(*args, **kwargs))
-                else:
-                    listener(*args, **kwargs)
+        listeners = self.listeners.get(event)
+        if listeners is None:
+            return
+
+        for listener, is_coro in listeners:
+            if is_coro:
+                asyncio.create_task(listener(*args, **kwargs))
+            else:
+                listener(*args, **kwargs)
 
     async def dispatch_and_await(self, event, *args, **kwargs):
         """
         Dispatch an event and await all listeners to complete.
         """
-        if event in self.listeners:
-            for listener in self.listeners[event]:
-                if asyncio.iscoroutinefunction(listener):
-                    await listener(*args, **kwargs)
-                else:
-                    listener(*args, **kwargs)
+        listeners = self.listeners.get(event)
+        if listeners is None:
+            return
+
+        for listener, is_coro in listeners:
+            if is_coro:
+                await listener(*args, **kwargs)
+            else:
+                listener(*args, **kwargs)
 
     def on(self, event: str, listener: T) -> None:
         if event not in self.listeners:
             self.listeners[event] = []
-        self.listeners[event].append(listener)
+        self.listeners[event].append((listener, asyncio.iscoroutinefunction(listener)))
 
         return self
@@ -1,17 +1,15 @@
 import random
+import time
 import uuid
-from datetime import datetime, timedelta
 
 
 def guid() -> str:
-    random_uuid = uuid.uuid4()
-    guid = str(random_uuid).replace("-", "")
-    return guid
+    return uuid.uuid4().hex
 
 
 def get_now_ts() -> int:
     """Timestamp in milliseconds for the current time."""
-    return int(datetime.now().timestamp() * 1000)
+    return time.time_ns() // 1_000_000
 
 
 def get_bucket_size(resolution: str) -> int:
@@ -41,16 +39,9 @@ def get_lookback_timestamp(days: int = None, hours: int = None) -> int:
     if days is None and hours is None:
         raise ValueError("At least one of 'days' or 'hours' must be provided")
 
-    current_datetime = datetime.now()
+    lookback_ms = int((days or 0) * 86_400_000 + (hours or 0) * 3_600_000)
 
-    if days is not None:
-        lookback_datetime = current_datetime - timedelta(days=days)
-    if hours is not None:
-        lookback_datetime = current_datetime - timedelta(hours=hours)
-    if days is not None and hours is not None:
-        lookback_datetime = current_datetime - timedelta(days=days, hours=hours)
-
-    return int(lookback_datetime.timestamp() * 1000)
+    return get_now_ts() - lookback_ms
 
 
 def get_exponential_backoff_delay(
@@ -1,10 +1,11 @@
 import asyncio
-from collections import defaultdict
+from array import array
 from dataclasses import asdict
+from operator import attrgetter
 import warnings
 import traceback
 from typing import Any, Dict, List, Literal, Optional, Union
-
+import numpy as np
 from superalgorithm.types.data_types import (
     OHLCV,
     AnnotationPoint,
@@ -24,23 +25,65 @@ from superalgorithm.utils.event_emitter import EventEmitter
 from superalgorithm.utils.helpers import get_now_ts
 from superalgorithm.utils.config import config
 
+# (open, high, low, close, volume) of an OHLCV chart value, as laid out in the chart data array
+_ohlcv_values = attrgetter("open", "high", "low", "close", "volume")
 
-class StrategyMonitor(EventEmitter, AsyncTaskManager):
 
-    _monitoring: Dict[str, MonitoringPoint] = {}
-    _chart_schema: Dict[str, ChartSchema] = {}
-    _chart_points: List[ChartPoint] = []
-    _annotations: List[AnnotationPoint] = []
-    _log: List[LogMessagePoint] = []
-    _trades: List[Trade] = []
-    _orders: List[Order] = []
-    _positions: List[Position] = []
+class ChartPointBuffer:
+    def __init__(self):
+        """
+        Column wise storage for the chart points buffered between uploads, instead of keeping one ChartPoint object per point.
+
+        Every point takes one entry in `timestamps` and `series` (the id of its chart name) and 5 entries in `values`:
+        open, high, low, close, volume for OHLCV points, or the value followed by 4 zeros for float points.
+        """
+        self.series_ids: Dict[str, int] = {}
+        self.timestamps = array("q")
+        self.series = array("i")
+        self.values = array("d")
+
+    def append(self, chart_point: ChartPoint):
+        series_id = self.series_ids.get(chart_point.name)
+        if series_id is None:
+            series_id = self.series_ids[chart_point.name] = len(self.series_ids)
+
+        self.timestamps.append(int(chart_point.timestamp))
+        self.series.append(series_id)
+        value = chart_point.value
+        if isinstance(value, OHLCV):
+            self.values.extend(_ohlcv_values(value))
+        else:
+            self.values.extend((value, 0.0, 0.0, 0.0, 0.0))
+
+    def clear(self):
+        del self.timestamps[:]
+        del self.series[:]
+        del self.values[:]
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+
+class StrategyMonitor(EventEmitter, AsyncTaskManager):
 
     def __init__(self, upload_interval: int = 10):
 
         EventEmitter.__init__(self)
         AsyncTaskManager.__init__(self)
 
+        # buffers are per instance, so separate monitors never share (and upload) each other's data
+        self._monitoring: Dict[str, MonitoringPoint] = {}
+        self._chart_schema: Dict[str, ChartSchema] = {}
+        self._chart_points = ChartPointBuffer()
+        self._annotations: List[AnnotationPoint] = []
+        self._log: List[LogMessagePoint] = []
+        self._trades: List[Trade] = []
+        self._orders: List[Order] = []
+        self._positions: List[Position] = []
+
+        # data point type -> (buffer add function, default timestamp function), built on first use, see _build_handlers
+        self._handlers = None
+
         self.initialized = True
         self.upload_interval = upload_interval
         self.session_id = guid()
@@ -68,96 +111,112 @@ class StrategyMonitor(EventEmitter, AsyncTaskManager):
 
         return super().start()
 
-    def add_data_point(self, data_point: Any, timestamp=None):
-        # Order, Trade, ChartPoint and AnnotationPoint use the highest timestamp seen by the strategy to support backtesting.
+    def _build_handlers(self):
+        # status_tracker is imported here, importing it at module level is circular (exchange -> logging)
         from superalgorithm.exchange.status_tracker import get_highest_timestamp
 
-        if isinstance(data_point, MonitoringPoint):
-            data_point.timestamp = get_now_ts() if timestamp is None else timestamp
-            self._monitoring[data_point.name] = data_point
-        elif isinstance(data_point, ChartPoint):
-            data_point.timestamp = (
-                get_highest_timestamp() if timestamp is None else timestamp
-            )
-            self._chart_points.append(data_point)
-        elif isinstance(data_point, AnnotationPoint):
-            data_point.timestamp = (
-                get_highest_timestamp() if timestamp is None else timestamp
-            )
-            self._annotations.append(data_point)
-        elif isinstance(data_point, LogMessagePoint):
-            data_point.timestamp = get_now_ts() if timestamp is None else timestamp
-            self._log.append(data_point)
-        elif isinstance(data_point, Trade):
-            data_point.timestamp = (
-                get_highest_timestamp() if timestamp is None else timestamp
-            )
-            self._trades.append(data_point)
-        elif isinstance(data_point, Order):
-            data_point.timestamp = (
-                get_highest_timestamp() if timestamp is None else timestamp
-            )
-            self._orders.append(data_point)
-        elif isinstance(data_point, Position):
-            data_point.timestamp = (
-                get_highest_timestamp() if timestamp is None else timestamp
-            )
-            self._positions.append(data_point)
+        # Order, Trade, Position, ChartPoint and AnnotationPoint use the highest timestamp seen by the strategy to support backtesting.
+        self._handlers = {
+            MonitoringPoint: (self._add_monitoring_point, get_now_ts),
+            ChartPoint: (self._chart_points.append, get_highest_timestamp),
+            AnnotationPoint: (self._annotations.append, get_highest_timestamp),
+            LogMessagePoint: (self._log.append, get_now_ts),
+            Trade: (self._trades.append, get_highest_timestamp),
+            Order: (self._orders.append, get_highest_timestamp),
+            Position: (self._positions.append, get_highest_timestamp),
+        }
+        return self._handlers
+
+    def add_data_point(self, data_point: Any, timestamp=None):
+        handlers = self._handlers or self._build_handlers()
+        handler = handlers.get(type(data_point))
+        if handler is None:
+            handler = self._find_handler(data_point)
+            if handler is None:
+                return
+
+        add, default_timestamp = handler
+        data_point.timestamp = default_timestamp() if timestamp is None else timestamp
+        add(data_point)
+
+    def _find_handler(self, data_point: Any):
+        """
+        Resolves the handler for subclasses of the known data point types and caches it for the subclass.
+        """
+        for data_type, handler in list(self._handlers.items()):
+            if isinstance(data_point, data_type):
+                self._handlers[type(data_point)] = handler
+                return handler
+        return None
+
+    def _add_monitoring_point(self, data_point: MonitoringPoint):
+        self._monitoring[data_point.name] = data_point
 
     async def _upload_periodically(self):
+        # uploads are scheduled against absolute deadlines, so the time spent uploading doesn't push back the next upload
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
         while True:
-            await asyncio.sleep(self.upload_interval)
-            self._upload_data()
+            deadline += self.upload_interval
+            await asyncio.sleep(max(0, deadline - loop.time()))
+            await self._upload_data()
+            # after an upload slower than the interval, run the next one right away instead of catching up on every missed one
+            deadline = max(deadline, loop.time() - self.upload_interval)
 
-    def convert_chart_data(self, chart_points: List[ChartPoint]):
+    def convert_chart_data(self, chart_points: ChartPointBuffer):
         """
         Convert the chart data into a chart chunk that can be uploaded to the server.
         """
 
-        grouped_chart_points = defaultdict(list)
-        unique_timestamps = set()
-
-        # Group ChartPoints by name and collect unique timestamps
-        for chart_point in chart_points:
-            grouped_chart_points[chart_point.name].append(chart_point)
-            unique_timestamps.add(chart_point.timestamp)
-
-        sorted_timestamps = sorted(unique_timestamps)  # Sort unique timestamps
-
-        data_array_settings = {
-            schema.name: {
-                "length": (1 if schema.data_type == ChartPointDataType.FLOAT else 5),
-                "data_index": sum(
-                    1 if s.data_type == ChartPointDataType.FLOAT else 5
-                    for s in list(self._chart_schema.values())[:i]
-                ),
-            }
-            for i, schema in enumerate(self._chart_schema.values())
-        }
-
-        data_array_length = sum(v["length"] for v in data_array_settings.values())
-        # Initialize the data dictionary with a 0s filled array as per the required length for each timestamp
-        # i.e. a schema with 2 float fields and 1 OHLCV field will have a length of 7 and is initialized as [0, 0, 0, 0, 0, 0, 0]
-        data = {timestamp: [0] * data_array_length for timestamp in sorted_timestamps}
-
-        # Populate the data with actual values from the chart points
+        # np.array copies the buffers, so the array.array columns stay resizable while we work on them
+        timestamps = np.array(chart_points.timestamps, dtype=np.longlong)
+        series = np.array(chart_points.series, dtype=np.intc)
+        point_values = np.array(chart_points.values, dtype=np.float64).reshape(-1, 5)
+
+        if np.all(timestamps[1:] >= timestamps[:-1]):
+            # points usually arrive in time order, then dropping adjacent duplicates replaces the sort
+            is_new = np.empty(len(timestamps), dtype=bool)
+            is_new[0] = True
+            np.not_equal(timestamps[1:], timestamps[:-1], out=is_new[1:])
+            sorted_timestamps = timestamps[is_new]
+            # row of every point in the dense data array below
+            rows = np.cumsum(is_new) - 1
+        else:
+            sorted_timestamps = np.unique(timestamps)
+            rows = np.searchsorted(sorted_timestamps, timestamps)
+        sorted_timestamps = sorted_timestamps.tolist()
+
+        # each schema occupies 1 (float) or 5 (ohlcv) slots, its data_index is the running offset of the schemas before it
+        float_type = ChartPointDataType.FLOAT
+        data_array_settings = {}
+        offset = 0
+        for schema in self._chart_schema.values():
+            length = 1 if schema.data_type == float_type else 5
+            data_array_settings[schema.name] = {"length": length, "data_index": offset}
+            offset += length
+
+        data_array_length = offset
+        # all values are written into one dense (timestamps x slots) array, rows are found by binary search on the sorted timestamps
+        # i.e. a schema with 2 float fields and 1 OHLCV field will have a row length of 7, initialized as [0, 0, 0, 0, 0, 0, 0]
+        values = np.zeros((len(sorted_timestamps), data_array_length), dtype=np.float64)
+
+        # Populate the array with actual values from the chart points, one vectorized store per schema
         for schema_name, schema in self._chart_schema.items():
+            series_id = chart_points.series_ids.get(schema_name)
+            if series_id is None:
+                continue
+            in_series = series == series_id
+
             # Get index offset based on the schema order
             index_offset = data_array_settings[schema_name]["data_index"]
-            # Get points for this chart name and populate the result arrays
-            if schema_name in grouped_chart_points:
-                for point in grouped_chart_points[schema_name]:
-                    timestamp = point.timestamp
-                    if schema.data_type == ChartPointDataType.FLOAT:
-                        data[timestamp][index_offset] = point.value
-                    elif schema.data_type == ChartPointDataType.OHLCV:
-                        data[timestamp][index_offset : index_offset + 5] = [
-                            point.value.open,
-                            point.value.high,
-                            point.value.low,
-                            point.value.close,
-                            point.value.volume,
-                        ]
+            if schema.data_type == float_type:
+                values[rows[in_series], index_offset] = point_values[in_series, 0]
+            elif schema.data_type == ChartPointDataType.OHLCV:
+                values[rows[in_series], index_offset : index_offset + 5] = (
+                    point_values[in_series]
+                )
+
+        data = dict(zip(sorted_timestamps, values.tolist()))
 
         return {
             "timestamp": sorted_timestamps[0],
@@ -177,28 +236,27 @@ class StrategyMonitor(EventEmitter, AsyncTaskManager):
         """
         data = []
         if len(self._chart_points) > 0:
-            data.extend(
-                [
-                    {
-                        "type": "chart",
-                        "value": self.convert_chart_data(self._chart_points),
-                    }
-                ]
+            data.append(
+                {
+                    "type": "chart",
+                    "value": self.convert_chart_data(self._chart_points),
+                }
             )
-        data.extend(
-            [{"type": "annotation", "value": {**asdict(a)}} for a in self._annotations]
-        )
-        data.extend([{"type": "log", "value": {**asdict(e)}} for e in self._log])
-        data.extend(
-            [
-                {"type": "variable", "value": {**asdict(m)}}
-                for m in self._monitoring.values()
-            ]
+
+        # (update type, buffered points, serializer) in upload order
+        # monitoring values can be any type (including dataclasses), so they keep the recursive asdict
+        serializers = (
+            ("annotation", self._annotations, AnnotationPoint.to_dict),
+            ("log", self._log, LogMessagePoint.to_dict),
+            ("variable", self._monitoring.values(), asdict),
+            ("trade", self._trades, Trade.to_dict),
+            ("order", self._orders, Order.to_dict),
+            ("position", self._positions, Position.to_dict),
         )
-        data.extend([{"type": "trade", "value": {**t.to_dict()}} for t in self._trades])
-        data.extend([{"type": "order", "value": {**o.to_dict()}} for o in self._orders])
         data.extend(
-            [{"type": "position", "value": {**p.to_dict()}} for p in self._positions]
+            {"type": update_type, "value": to_dict(point)}
+            for update_type, points, to_dict in serializers
+            for point in points
         )
 
         return {
@@ -216,7 +274,7 @@ class StrategyMonitor(EventEmitter, AsyncTaskManager):
         self._orders.clear()
         self._positions.clear()
 
-    def _upload_data(self):
+    async def _upload_data(self):
         try:
             data_for_upload = self.serialize()
             self.clear()
@@ -224,7 +282,10 @@ class StrategyMonitor(EventEmitter, AsyncTaskManager):
 
             if len(data_for_upload.get("updates")) > 0:
                 print("Uploading log data", data_for_upload)
-                upload_log(data_for_upload)
+                # the request is blocking, run it in the default executor so the event loop keeps processing bars and trades
+                await asyncio.get_running_loop().run_in_executor(
+                    None, upload_log, data_for_upload
+                )
                 self.dispatch("upload_complete")
                 return
 
@@ -273,7 +334,6 @@ def chart(name: str, value: Union[float, OHLCV], timestamp=None):
 
 
 def annotate(value: Any, message: str, timestamp=None):
-    AnnotationPoint(value=value, message=message)
     strategy_monitor.add_data_point(
         AnnotationPoint(value=value, message=message), timestamp
     )
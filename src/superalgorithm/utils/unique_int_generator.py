@@ -1,3 +1,4 @@
+import itertools
 import random
 import threading
 import time
@@ -12,22 +13,17 @@ class UniqueIntGenerator:
             with cls._lock:
                 if not cls._instance:
                     cls._instance = super().__new__(cls)
-                    cls._instance._last_id = 0
+                    # ids count up from the start time in milliseconds followed by 4 digits
+                    # the random offset keeps processes started in the same millisecond apart
+                    # next() on itertools.count is atomic under the GIL, so ids need no lock
+                    start_id = (time.time_ns() // 1_000_000) * 10000
+                    cls._instance._counter = itertools.count(
+                        start_id + random.randint(0, 9999)
+                    )
         return cls._instance
 
     def generate_client_id(self) -> int:
-        with self._lock:
-            current_time = int(time.time() * 1000)
-            random_component = random.randint(0, 9999)
-
-            # Ensure monotonically increasing
-            candidate_id = int(f"{current_time}{random_component:04d}")
-            while candidate_id <= self._last_id:
-                random_component = random.randint(0, 9999)
-                candidate_id = int(f"{current_time}{random_component:04d}")
-
-            self._last_id = candidate_id
-            return candidate_id
+        return next(self._counter)
 
 
 # Singleton instance
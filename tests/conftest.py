@@ -1,3 +1,4 @@
+import asyncio
 import os
 import pytest
 import sys
@@ -9,3 +10,13 @@ def set_working_directory():
     sys.path.insert(
         0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
     )
+
+
+# run the async tests on uvloop when it is installed, it is not a dependency of the package
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
@@ -1,5 +1,6 @@
 import pytest
 
+from superalgorithm.data.data_provider import DataProvider
 from superalgorithm.data.providers.csv import CSVDataSource
 
 
@@ -14,3 +15,21 @@ async def test_csv_import():
         data.append(item)
 
     assert len(data) > 0, "Expected non-empty data from CSVDataSource.read()"
+
+
+@pytest.mark.asyncio
+async def test_csv_iter_data_matches_read():
+    async_source = CSVDataSource("BTC/USDT", "5m")
+    await async_source.connect()
+    async_data = [item async for item in async_source.read()]
+
+    data_provider = DataProvider()
+    data_provider.add_data_source(CSVDataSource("BTC/USDT", "5m"))
+    bars = data_provider.iter_data()
+    assert bars is not None, "Expected CSVDataSource to support synchronous reads"
+
+    await data_provider.connect()
+    sync_data = list(bars)
+
+    assert sync_data == async_data
+    assert sync_data[-1] == (None, False)
@@ -1,7 +1,10 @@
+import copy
+import pickle
 import pytest
 
 from superalgorithm.data.ohlcv_aggregator import OHLCVAggregator
 from superalgorithm.types import OHLCV
+from superalgorithm.types.data_types import Bar
 
 # binance static test data
 hourly = [
@@ -78,3 +81,14 @@ def test_aggregate_daily():
     assert last_conmpleted_bar.low == 62373.24
     assert last_conmpleted_bar.close == 65043.99
     assert last_conmpleted_bar.volume == 42530.52915
+
+
+def test_ohlcv_copy_and_pickle():
+    ohlcv = OHLCV(*hourly[0])
+    bar = Bar(ohlcv.timestamp, "BTC/USDT", "1h", ohlcv)
+
+    for clone in (copy.copy, copy.deepcopy, lambda o: pickle.loads(pickle.dumps(o))):
+        assert clone(ohlcv) == ohlcv
+        cloned_bar = clone(bar)
+        assert cloned_bar == bar
+        assert cloned_bar.close == ohlcv.close
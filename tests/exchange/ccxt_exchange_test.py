@@ -0,0 +1,44 @@
+import asyncio
+import pytest
+from superalgorithm.exchange.ccxt_exchange import CCXTExchange
+
+
+@pytest.fixture
+async def setup_exchange():
+    # not started, so nothing connects to the exchange
+    exchange = CCXTExchange("woo")
+
+    try:
+        yield exchange
+    finally:
+        await exchange.ccxt_client.close()
+
+
+@pytest.mark.asyncio
+async def test_unmatched_trade_retry_is_cancelled_on_stop(setup_exchange):
+    exchange: CCXTExchange = setup_exchange
+
+    processor = asyncio.create_task(exchange.process_trades())
+    exchange.trade_queue.put_nowait(
+        {
+            "id": "t1",
+            "timestamp": 1,
+            "symbol": "BTC/USDT",
+            "price": 1.0,
+            "amount": 1.0,
+            "order": "unknown",
+        }
+    )
+    await asyncio.sleep(0)
+
+    # no order matches the trade, so a retry is pending and referenced by the exchange
+    assert len(exchange._retry_tasks) == 1
+    (retry,) = exchange._retry_tasks
+
+    await exchange.stop()
+
+    assert retry.cancelled()
+    assert not exchange._retry_tasks
+
+    processor.cancel()
+    await asyncio.gather(processor, return_exceptions=True)
@@ -0,0 +1,59 @@
+from unittest.mock import Mock
+import pytest
+from superalgorithm.exchange.paper_exchange import PaperExchange
+from superalgorithm.types.data_types import (
+    Order,
+    OrderStatus,
+    OrderType,
+    PositionType,
+    TradeType,
+)
+from superalgorithm.utils.logging import strategy_monitor
+
+
+@pytest.fixture
+def order_manager():
+    return PaperExchange().order_manager
+
+
+@pytest.fixture
+def order(order_manager):
+    order = Order(
+        pair="BTC/USDT",
+        position_type=PositionType.LONG,
+        trade_type=TradeType.OPEN,
+        quantity=2,
+        price=10,
+        order_type=OrderType.LIMIT,
+    )
+    order_manager.add_order(order)
+    return order
+
+
+def logged_orders(order):
+    return [logged for logged in strategy_monitor._orders if logged is order]
+
+
+def test_fill_only_update(order_manager, order):
+    open_handler = Mock()
+    closed_handler = Mock()
+    order.on("OPEN", open_handler)
+    order.on("CLOSED", closed_handler)
+    logged = len(logged_orders(order))
+
+    # a partial fill without a status change is stored and logged
+    order_manager.on_order_update(order.client_order_id, 1, OrderStatus.OPEN)
+    assert order.filled == 1
+    assert len(logged_orders(order)) == logged + 1
+    open_handler.assert_not_called()
+
+    # the same update again changes nothing and is not logged
+    order_manager.on_order_update(order.client_order_id, 1, OrderStatus.OPEN)
+    assert len(logged_orders(order)) == logged + 1
+
+    # the final fill changes the status, which is dispatched and logged
+    order_manager.on_order_update(order.client_order_id, 2, OrderStatus.CLOSED)
+    assert order.filled == 2
+    assert order.order_status == OrderStatus.CLOSED
+    closed_handler.assert_called_once_with(order)
+    assert len(logged_orders(order)) == logged + 2
@@ -1,10 +1,11 @@
-import pytest
 import asyncio
-from datetime import datetime
+from collections import deque
+import pytest
 from superalgorithm.exchange.base_exchange import InsufficientFundsError
 from superalgorithm.exchange.paper_exchange import PaperExchange
 from superalgorithm.exchange.status_tracker import update_mark_ts
 from superalgorithm.types.data_types import OrderType, PositionType
+from superalgorithm.utils.helpers import get_now_ts
 from superalgorithm.utils.logging import strategy_monitor
 
 
@@ -13,8 +14,6 @@ async def setup_exchange():
     exchange = PaperExchange(initial_cash=10000)
     await exchange.start()
 
-    await asyncio.sleep(0.1)
-
     try:
         yield exchange
     finally:
@@ -48,9 +47,10 @@ async def test_stress_test(setup_exchange):
         has_order = False
         orders_filled += 1
 
-    while order_count != 0:
+    # limit orders fill at their own price, the mark never changes so it is set once
+    update_mark_ts("BTC/USD", get_now_ts(), 1)
 
-        update_mark_ts("BTC/USD", int(datetime.now().timestamp() * 1000), 1)
+    while order_count != 0:
 
         if not has_order:
 
@@ -62,12 +62,13 @@ async def test_stress_test(setup_exchange):
                 price=1.0,
             )
 
-            order.on("CLOSED", close_handler)  # order_closed_fut.set_result(None)
+            order.on("CLOSED", close_handler)
             has_order = True
 
-        trades_to_process = list(exchange.trade_tasks)
-        exchange.trade_tasks.clear()
-        await asyncio.gather(*trades_to_process)
+        # same drain as BaseStrategy._process_paper_trades, trades created while we wait are left for the next tick
+        trades_to_process = exchange.trade_tasks
+        exchange.trade_tasks = deque()
+        await asyncio.gather(*trades_to_process, return_exceptions=True)
 
         order_count -= 1
 
@@ -1,15 +1,22 @@
-import pytest
 import asyncio
+import pytest
 from datetime import datetime
 from superalgorithm.exchange.base_exchange import InsufficientFundsError
 from superalgorithm.exchange.paper_exchange import PaperExchange
 from superalgorithm.exchange.status_tracker import update_mark_ts
-from superalgorithm.types.data_types import OrderType, PositionType
+from superalgorithm.types.data_types import (
+    Order,
+    OrderStatus,
+    OrderType,
+    PositionType,
+    TradeType,
+)
 from superalgorithm.utils.logging import strategy_monitor
 
 """
 Orders in the paper exchange are submitted and closed via an async trade, just like in the real world.
 This means if you place and order, it's not immediately filled and CLOSED.
+Awaiting the returned order waits until it is CLOSED.
 
 Mark Price: the paper exchange requires a mark price and the latest timestamp during a backtest. 
 This is handled automatically by the BaseStrategy while processing data, but for the tests below we have to set this manually.
@@ -21,180 +28,160 @@ async def setup_exchange():
     exchange = PaperExchange(initial_cash=10000)
     await exchange.start()
 
-    await asyncio.sleep(0.1)
-
     try:
         yield exchange
     finally:
         await exchange.stop()
 
 
-async def test_open_long_paper(setup_exchange):
+@pytest.mark.parametrize(
+    "position_type, expected_cash",
+    [(PositionType.LONG, 9000), (PositionType.SHORT, 11000)],
+)
+async def test_open_close_paper(setup_exchange, position_type, expected_cash):
     exchange = setup_exchange
     # the paper exchange needs a mark price to know what time it is
     update_mark_ts("BTC/USD", int(datetime.now().timestamp()), 5000)
 
-    order_closed_fut = asyncio.Future()
-
-    (
+    await (
         await exchange.open(
             pair="BTC/USD",
-            position_type=PositionType.LONG,
+            position_type=position_type,
             quantity=1.0,
             order_type=OrderType.LIMIT,
             price=5000.0,
         )
-    ).on("CLOSED", lambda _: order_closed_fut.set_result(None))
+    )
 
-    await order_closed_fut
-
-    assert exchange.cash == 5000
+    if position_type == PositionType.LONG:
+        assert exchange.cash == 5000
 
     update_mark_ts("BTC/USD", int(datetime.now().timestamp()), 4000)
 
-    order_closed_fut = asyncio.Future()
-
-    (
+    await (
         await exchange.close(
             pair="BTC/USD",
-            position_type=PositionType.LONG,
+            position_type=position_type,
             quantity=1.0,
             order_type=OrderType.LIMIT,
             price=4000.0,
         )
-    ).on("CLOSED", lambda _: order_closed_fut.set_result(None))
+    )
 
-    await order_closed_fut
+    assert exchange.cash == expected_cash
 
-    assert exchange.cash == 9000
 
-
-async def test_long_out_of_cash(setup_exchange):
+async def test_await_order(setup_exchange):
     exchange = setup_exchange
-    # the paper exchange needs some mark price to know what time it is
     update_mark_ts("BTC/USD", int(datetime.now().timestamp()), 5000)
 
-    with pytest.raises(InsufficientFundsError):
-        await exchange.open(
-            pair="BTC/USD",
-            position_type=PositionType.LONG,
-            quantity=3.0,
-            order_type=OrderType.LIMIT,
-            price=5000.0,
-        )
+    order = await exchange.open(
+        pair="BTC/USD",
+        position_type=PositionType.LONG,
+        quantity=1.0,
+        order_type=OrderType.LIMIT,
+        price=5000.0,
+    )
 
+    closed = order.closed()
+    assert order.closed() is closed
 
-@pytest.mark.asyncio
-async def test_close_long_insufficient_balance(setup_exchange):
+    assert await order is order
+    assert order.order_status == OrderStatus.CLOSED
+    assert closed.result() is order
+    # awaiting an order that is already CLOSED returns right away
+    assert await order is order
+
+
+@pytest.mark.parametrize(
+    "order_status", [OrderStatus.CANCELED, OrderStatus.REJECTED, OrderStatus.EXPIRED]
+)
+async def test_await_order_not_filled(setup_exchange, order_status):
+    exchange = setup_exchange
+    order = Order(
+        pair="BTC/USD",
+        position_type=PositionType.LONG,
+        trade_type=TradeType.OPEN,
+        quantity=1.0,
+        price=5000.0,
+        order_type=OrderType.LIMIT,
+    )
+    exchange.order_manager.add_order(order)
+
+    waiter = asyncio.ensure_future(order.closed())
+    exchange.order_manager.on_order_update(order.client_order_id, 0, order_status)
+
+    assert await asyncio.wait_for(waiter, timeout=1) is order
+    assert order.order_status == order_status
+    # an order that already has a final status resolves right away
+    assert await order is order
+
+
+@pytest.mark.parametrize("position_type", [PositionType.LONG, PositionType.SHORT])
+async def test_open_out_of_cash(setup_exchange, position_type):
     exchange = setup_exchange
     # the paper exchange needs some mark price to know what time it is
     update_mark_ts("BTC/USD", int(datetime.now().timestamp()), 5000)
 
-    order_closed_fut = asyncio.Future()
-
-    (
-        await exchange.open(
-            pair="BTC/USD",
-            position_type=PositionType.LONG,
-            quantity=2.0,
-            order_type=OrderType.LIMIT,
-            price=5000.0,
-        )
-    ).on("CLOSED", lambda _: order_closed_fut.set_result(None))
-
-    await order_closed_fut
-
     with pytest.raises(InsufficientFundsError):
-        await exchange.close(
+        await exchange.open(
             pair="BTC/USD",
-            position_type=PositionType.LONG,
-            quantity=6.0,
+            position_type=position_type,
+            quantity=3.0,
             order_type=OrderType.LIMIT,
             price=5000.0,
         )
 
 
-@pytest.mark.asyncio
-async def test_open_short(setup_exchange):
+@pytest.mark.parametrize(
+    "position_type, close_quantity",
+    [(PositionType.LONG, 6.0), (PositionType.SHORT, 3.0)],
+)
+async def test_close_insufficient_balance(
+    setup_exchange, position_type, close_quantity
+):
     exchange = setup_exchange
-
     # the paper exchange needs some mark price to know what time it is
     update_mark_ts("BTC/USD", int(datetime.now().timestamp()), 5000)
 
-    order_closed_fut = asyncio.Future()
-
-    (
+    await (
         await exchange.open(
             pair="BTC/USD",
-            position_type=PositionType.SHORT,
-            quantity=1.0,
+            position_type=position_type,
+            quantity=2.0,
             order_type=OrderType.LIMIT,
             price=5000.0,
         )
-    ).on("CLOSED", lambda _: order_closed_fut.set_result(None))
-
-    await order_closed_fut
-
-    update_mark_ts("BTC/USD", int(datetime.now().timestamp()), 4000)
-
-    order_closed_fut = asyncio.Future()
-
-    (
-        await exchange.close(
-            pair="BTC/USD",
-            position_type=PositionType.SHORT,
-            quantity=1.0,
-            order_type=OrderType.LIMIT,
-            price=4000.0,
-        )
-    ).on("CLOSED", lambda _: order_closed_fut.set_result(None))
-
-    await order_closed_fut
-
-    assert exchange.cash == 11000
-
-
-@pytest.mark.asyncio
-async def test_short_out_of_cash(setup_exchange):
-    exchange = setup_exchange
-    # the paper exchange needs some mark price to know what time it is
-    update_mark_ts("BTC/USD", int(datetime.now().timestamp()), 5000)
+    )
 
     with pytest.raises(InsufficientFundsError):
-        await exchange.open(
+        await exchange.close(
             pair="BTC/USD",
-            position_type=PositionType.SHORT,
-            quantity=3.0,
+            position_type=position_type,
+            quantity=close_quantity,
             order_type=OrderType.LIMIT,
             price=5000.0,
         )
 
 
 @pytest.mark.asyncio
-async def test_close_short_insufficient_balance(setup_exchange):
+async def test_get_balances(setup_exchange):
     exchange = setup_exchange
-    # the paper exchange needs some mark price to know what time it is
-    update_mark_ts("BTC/USD", int(datetime.now().timestamp()), 5000)
+    update_mark_ts("ETH/USD", int(datetime.now().timestamp()), 1000)
 
-    order_closed_fut = asyncio.Future()
-
-    (
+    await (
         await exchange.open(
-            pair="BTC/USD",
-            position_type=PositionType.SHORT,
+            pair="ETH/USD",
+            position_type=PositionType.LONG,
             quantity=2.0,
             order_type=OrderType.LIMIT,
-            price=5000.0,
+            price=1000.0,
         )
-    ).on("CLOSED", lambda _: order_closed_fut.set_result(None))
+    )
 
-    await order_closed_fut
+    balances = await exchange.get_balances()
 
-    with pytest.raises(InsufficientFundsError):
-        await exchange.close(
-            pair="BTC/USD",
-            position_type=PositionType.SHORT,
-            quantity=3.0,
-            order_type=OrderType.LIMIT,
-            price=5000.0,
-        )
+    assert balances.free["USD"] == 8000
+    assert balances.free["ETH/USD"] == 2.0
+    assert balances.total["ETH/USD"] == 2.0
+    assert balances.currencies["ETH/USD"].used == 0
@@ -0,0 +1,96 @@
+import pytest
+from superalgorithm.exchange.paper_exchange import PaperExchange
+from superalgorithm.exchange.status_tracker import (
+    get_highest_timestamp,
+    update_mark_ts,
+)
+from superalgorithm.types.data_types import (
+    Order,
+    OrderType,
+    PositionType,
+    Trade,
+    TradeType,
+)
+from superalgorithm.utils.helpers import get_now_ts
+
+
+def create_trade(trade_id, pair, position_type, trade_type=TradeType.OPEN):
+    return Trade(
+        trade_id=trade_id,
+        timestamp=123,
+        pair=pair,
+        position_type=position_type,
+        trade_type=trade_type,
+        price=10,
+        quantity=1,
+        server_order_id=f"server-{trade_id}",
+    )
+
+
+@pytest.fixture
+def position_manager():
+    position_manager = PaperExchange().position_manager
+    position_manager.add_trade(create_trade("1", "BTC/USDT", PositionType.LONG))
+    position_manager.add_trade(create_trade("2", "BTC/USDT", PositionType.SHORT))
+    position_manager.add_trade(
+        create_trade("3", "BTC/USDT", PositionType.LONG, TradeType.CLOSE)
+    )
+    position_manager.add_trade(create_trade("4", "ETH/USDT", PositionType.LONG))
+    return position_manager
+
+
+def trade_ids(trades):
+    return sorted(trade.trade_id for trade in trades)
+
+
+def test_list_trades_single_pair(position_manager):
+    assert trade_ids(position_manager.list_trades(pair="ETH/USDT")) == ["4"]
+    assert trade_ids(position_manager.list_trades(pair="BTC/USDT")) == ["1", "2", "3"]
+    assert trade_ids(
+        position_manager.list_trades(
+            pair="BTC/USDT",
+            position_type=PositionType.LONG,
+            trade_type=TradeType.OPEN,
+        )
+    ) == ["1"]
+
+
+def test_list_trades_all_pairs(position_manager):
+    assert trade_ids(position_manager.list_trades()) == ["1", "2", "3", "4"]
+    assert trade_ids(
+        position_manager.list_trades(position_type=PositionType.LONG)
+    ) == ["1", "3", "4"]
+    assert trade_ids(position_manager.list_trades(trade_type=TradeType.CLOSE)) == [
+        "3"
+    ]
+
+
+def test_list_trades_unknown_pair(position_manager):
+    assert position_manager.list_trades(pair="XRP/USDT") == []
+    assert PaperExchange().position_manager.list_trades(pair="BTC/USDT") == []
+
+
+def test_created_at_follows_logged_trade_timestamp():
+    exchange = PaperExchange()
+    order = Order(
+        pair="BTC/USDT",
+        position_type=PositionType.LONG,
+        trade_type=TradeType.OPEN,
+        quantity=1,
+        price=10,
+        order_type=OrderType.LIMIT,
+        server_order_id="server-1",
+    )
+    exchange.order_manager.add_order(order)
+    trade = create_trade("1", "BTC/USDT", PositionType.LONG)
+    # a known mark keeps the highest timestamp fixed instead of falling back to the clock
+    update_mark_ts("BTC/USDT", get_now_ts(), 10)
+    highest_timestamp = get_highest_timestamp()
+
+    # matching adds the trade to the position, then log_trade sets its timestamp to the highest seen timestamp
+    assert not exchange.trade_manager.try_add(trade)
+
+    position = exchange.position_manager.positions["BTC/USDT"][PositionType.LONG]
+    assert trade.timestamp == highest_timestamp != 123
+    assert position.createdAt == trade.timestamp
+    assert position.to_dict()["timestamp"] == trade.timestamp
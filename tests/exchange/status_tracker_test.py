@@ -53,3 +53,41 @@ def test_update_ts_price_with_newer_timestamp(tracker):
 
     assert latest_price.timestamp == timestamp_new
     assert latest_price.mark == mark_price_new
+
+
+def test_update_ts_price_many_pairs():
+    tracker = StatusTracker()
+
+    for i in range(5):
+        update_mark_ts(f"PAIR{i}/USD", 1625097600 + i, float(i), tracker=tracker)
+
+    for i in range(5):
+        latest_price = get_latest_price(f"PAIR{i}/USD", tracker=tracker)
+        assert latest_price.timestamp == 1625097600 + i
+        assert latest_price.mark == float(i)
+
+    assert tracker.get_highest_timestamp() == 1625097604
+
+
+def test_update_ts_price_coerces_types(tracker):
+    pair = "BTC/USD"
+
+    # i.e. time.time() * 1000 gives a float timestamp, prices may come in as int or str
+    update_mark_ts(pair, 1625097600123.7, 34000, tracker=tracker)
+    latest_price = get_latest_price(pair, tracker=tracker)
+
+    assert latest_price.timestamp == 1625097600123
+    assert latest_price.mark == 34000.0
+    assert tracker.get_highest_timestamp() == 1625097600123
+
+    update_mark_ts(pair, 1625097600200.0, "34001.5", tracker=tracker)
+    assert get_latest_price(pair, tracker=tracker).mark == 34001.5
+
+
+def test_update_ts_price_rejects_missing_price(tracker):
+    with pytest.raises(ValueError, match="BTC/USD"):
+        update_mark_ts("BTC/USD", 1625097600, None, tracker=tracker)
+
+    # the rejected update doesn't register the pair
+    with pytest.raises(ValueError, match="No price data"):
+        get_latest_price("BTC/USD", tracker=tracker)
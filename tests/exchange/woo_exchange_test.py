@@ -9,21 +9,19 @@ from superalgorithm.types.data_types import (
 from superalgorithm.utils.config import config
 
 
-api_key = config.get("ccxt_config")["api_key"]
-api_secret = config.get("ccxt_config")["secret"]
-app_id = config.get("ccxt_config")["uid"]
-ccxt_config = {
-    "apiKey": api_key,
-    "secret": api_secret,
-    "uid": app_id,
-    "hedge_mode": True,
-}
-
 symbol = "PNUT/USDT:USDT"
 
 
 @pytest.fixture(scope="module")
 async def setup_exchange():
+    # credentials are read when the fixture runs, so collecting the module doesn't need a config
+    woo_config = config.get("ccxt_config")
+    ccxt_config = {
+        "apiKey": woo_config["api_key"],
+        "secret": woo_config["secret"],
+        "uid": woo_config["uid"],
+        "hedge_mode": True,
+    }
     exchange = WOOExchange(config=ccxt_config)
 
     await exchange.start()
@@ -46,7 +44,8 @@ async def fetch_markprice(exchange, symbol):
     """
     Helper method to get the current price for placing test orders.
     """
-    kline = await exchange.ccxt_client.fetchOHLCV(symbol)
+    # only the latest candle is needed, ccxt's woo client has no fetchTicker
+    kline = await exchange.ccxt_client.fetchOHLCV(symbol, limit=1)
     mark_price = kline[-1][4]
     return mark_price
 
@@ -58,21 +57,16 @@ async def execute_order_and_wait_close(
     Helper method to place test orders.
     """
     order = None
-    order_closed_fut = asyncio.Future()
     if order_type == "open":
         order = await exchange.open(
             pair, position_type, quantity, OrderType.LIMIT, price
         )
-        order.on("CLOSED", lambda _: order_closed_fut.set_result(None))
     elif order_type == "close":
         order = await exchange.close(
             pair, position_type, quantity, OrderType.LIMIT, price
         )
-        order.on("CLOSED", lambda _: order_closed_fut.set_result(None))
-
-    await order_closed_fut
 
-    return order
+    return await order
 
 
 @pytest.mark.asyncio(loop_scope="module")
@@ -129,19 +123,17 @@ async def test_cancel_order(setup_exchange):
 @pytest.mark.asyncio(loop_scope="module")
 async def test_cancel_all_orders(setup_exchange):
     exchange, mark_price, quantity = setup_exchange
-    order = await exchange.open(
-        symbol,
-        PositionType.LONG,
-        quantity * 2,
-        OrderType.LIMIT,
-        mark_price - 0.10,
-    )
-    order2 = await exchange.open(
-        symbol,
-        PositionType.LONG,
-        quantity * 2,
-        OrderType.LIMIT,
-        mark_price - 0.10,
+    order, order2 = await asyncio.gather(
+        *(
+            exchange.open(
+                symbol,
+                PositionType.LONG,
+                quantity * 2,
+                OrderType.LIMIT,
+                mark_price - 0.10,
+            )
+            for _ in range(2)
+        )
     )
 
     response = await exchange.cancel_all_orders()
@@ -184,19 +176,22 @@ async def test_hedge_mode(setup_exchange):
 
     exchange, mark_price, quantity = setup_exchange
 
-    order = await exchange.open(
-        symbol,
-        PositionType.LONG,
-        quantity * 2,
-        OrderType.LIMIT,
-        mark_price - 0.1,
-    )
-    order2 = await exchange.open(
-        symbol,
-        PositionType.SHORT,
-        quantity * 2,
-        OrderType.LIMIT,
-        mark_price + 0.1,
+    # both sides are placed concurrently, in hedge mode they don't depend on each other
+    order, order2 = await asyncio.gather(
+        exchange.open(
+            symbol,
+            PositionType.LONG,
+            quantity * 2,
+            OrderType.LIMIT,
+            mark_price - 0.1,
+        ),
+        exchange.open(
+            symbol,
+            PositionType.SHORT,
+            quantity * 2,
+            OrderType.LIMIT,
+            mark_price + 0.1,
+        ),
     )
 
     await exchange.cancel_all_orders(symbol)
@@ -209,56 +204,26 @@ async def test_hedge_mode(setup_exchange):
 async def test_market_order(setup_exchange):
 
     exchange, mark_price, quantity = setup_exchange
-    order_complete_fut = asyncio.Future()
-    order = await exchange.open(
-        symbol,
-        PositionType.LONG,
-        quantity,
-        OrderType.MARKET,
-    )
-
-    order.on("CLOSED", lambda _: order_complete_fut.set_result(None))
 
-    await order_complete_fut
-
-    order_complete_fut = asyncio.Future()
-    order2 = await exchange.open(
-        symbol,
-        PositionType.SHORT,
-        quantity,
-        OrderType.MARKET,
+    # long and short are independent in hedge mode, so each pair is placed and awaited together
+    order, order2 = await asyncio.gather(
+        exchange.open(symbol, PositionType.LONG, quantity, OrderType.MARKET),
+        exchange.open(symbol, PositionType.SHORT, quantity, OrderType.MARKET),
     )
-    order2.on("CLOSED", lambda _: order_complete_fut.set_result(None))
 
-    await order_complete_fut
+    await asyncio.gather(order, order2)
 
     assert order.order_status == OrderStatus.CLOSED
     assert order2.order_status == OrderStatus.CLOSED
 
     # closing the positions
 
-    order_complete_fut = asyncio.Future()
-    order = await exchange.close(
-        symbol,
-        PositionType.LONG,
-        quantity,
-        OrderType.MARKET,
-    )
-
-    order.on("CLOSED", lambda _: order_complete_fut.set_result(None))
-
-    await order_complete_fut
-
-    order_complete_fut = asyncio.Future()
-    order2 = await exchange.close(
-        symbol,
-        PositionType.SHORT,
-        quantity,
-        OrderType.MARKET,
+    order, order2 = await asyncio.gather(
+        exchange.close(symbol, PositionType.LONG, quantity, OrderType.MARKET),
+        exchange.close(symbol, PositionType.SHORT, quantity, OrderType.MARKET),
     )
-    order2.on("CLOSED", lambda _: order_complete_fut.set_result(None))
 
-    await order_complete_fut
+    await asyncio.gather(order, order2)
 
     assert exchange.position_manager.positions[symbol][PositionType.LONG].balance == 0
     assert exchange.position_manager.positions[symbol][PositionType.SHORT].balance == 0
@@ -1,8 +1,9 @@
+import asyncio
 from unittest.mock import Mock
 import pytest
 from superalgorithm.data.providers.csv import CSVDataSource
 from superalgorithm.exchange.paper_exchange import PaperExchange
-from superalgorithm.strategy.base_strategy import BaseStrategy
+from superalgorithm.strategy.base_strategy import PAPER_YIELD_INTERVAL, BaseStrategy
 from superalgorithm.types.data_types import (
     Bar,
     ChartPointDataType,
@@ -14,6 +15,10 @@ from superalgorithm.utils.api_client import api_call
 from superalgorithm.utils.bar_utils import is_new_bar
 from superalgorithm.utils.logging import chart, set_chart_schema, strategy_monitor
 
+# 5m closes at which the test strategy opens or closes a position
+OPEN_PRICES = frozenset({64120.39, 60313.31})
+CLOSE_PRICES = frozenset({61427.72, 61371.27})
+
 
 class TestStrategy(BaseStrategy):
 
@@ -29,11 +34,12 @@ class TestStrategy(BaseStrategy):
     async def on_5m(self, bar: Bar):
         self.tick_called = True
         assert isinstance(bar, Bar)
-        assert bar.close == self.get("BTC/USDT", "5m").close
+        current = self.get("BTC/USDT", "5m")
+        assert bar.close == current.close
         chart(
             "BTC/USDT", bar.ohlcv
         )  # TODO: when we pass just bar, which is wrong, it breaks internally but no error is given we can fix?
-        await self.trade_logic()
+        await self.trade_logic(current)
 
     async def on_1h(self, bar: Bar):
         self.tick_called = True
@@ -48,16 +54,16 @@ class TestStrategy(BaseStrategy):
             self.new_bar_called = True
             assert bar.timestamp % 3600000 == 0  # Full hour
             assert bar.close == self.get("BTC/USDT", "1h").close
-            await self.trade_logic()
+            await self.trade_logic(self.get("BTC/USDT", "5m"))
 
-    async def trade_logic(self):
-        close = self.get("BTC/USDT", "5m").close
-        if close == 64120.39 or close == 60313.31:
+    async def trade_logic(self, bar: Bar):
+        close = bar.close
+        if close in OPEN_PRICES:
             await self.exchange.open(
                 "BTC/USDT", PositionType.LONG, 1, OrderType.LIMIT, close
             )
 
-        if close == 61427.72 or close == 61371.27:
+        if close in CLOSE_PRICES:
             await self.exchange.close(
                 "BTC/USDT", PositionType.LONG, 1, OrderType.LIMIT, close
             )
@@ -127,3 +133,41 @@ async def test_strategy():
     # # Print or save the JSON data
     # with open("strategy_monitor.json", "w") as file:
     #     file.write(json_data)
+
+
+class IdleStrategy(BaseStrategy):
+    def init(self):
+        pass
+
+    async def on_tick(self, bar: Bar):
+        pass
+
+    async def trade_logic(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_backtest_yields_to_background_tasks():
+    strategy = IdleStrategy(
+        data_sources=[CSVDataSource("BTC/USDT", "5m")],
+        exchange=PaperExchange(initial_cash=100000),
+    )
+
+    # counts how often the backtest loop lets other tasks run, none of its bars create paper trades
+    turns = 0
+
+    async def background():
+        nonlocal turns
+        while True:
+            turns += 1
+            await asyncio.sleep(0)
+
+    task = asyncio.create_task(background())
+    await asyncio.sleep(0)
+    turns = 0
+
+    await strategy.start()
+    task.cancel()
+    await strategy.exchange.stop()
+
+    assert turns >= 12279 // PAPER_YIELD_INTERVAL
@@ -0,0 +1,37 @@
+import pytest
+from superalgorithm.utils import bar_utils
+from superalgorithm.utils.bar_utils import is_new_bar
+
+HOUR = 3_600_000
+
+
+@pytest.fixture
+def highest_timestamp(monkeypatch):
+    # fresh tracking state and a controllable clock for every test
+    monkeypatch.setattr(bar_utils, "_timeframe_state", {})
+    timestamp = [0]
+    monkeypatch.setattr(bar_utils, "get_highest_timestamp", lambda: timestamp[0])
+    return timestamp
+
+
+def test_is_new_bar(highest_timestamp):
+    highest_timestamp[0] = 5 * HOUR
+    assert not is_new_bar("1h")
+
+    highest_timestamp[0] = 5 * HOUR + 1000
+    assert not is_new_bar("1h")
+
+    highest_timestamp[0] = 6 * HOUR
+    assert is_new_bar("1h")
+    assert not is_new_bar("1h")
+
+
+def test_is_new_bar_called_before_any_bar(highest_timestamp):
+    # no timestamp is known yet, tracking must not start at interval 0
+    assert not is_new_bar("1h")
+
+    highest_timestamp[0] = 5 * HOUR
+    assert not is_new_bar("1h")
+
+    highest_timestamp[0] = 6 * HOUR
+    assert is_new_bar("1h")
@@ -78,6 +78,33 @@ def test_chart_logs_integers():
     assert len(strategy_monitor._chart_points) == 7
 
 
+def test_chart_in_order_matches_sorted():
+    set_chart_schema(
+        [
+            ChartSchema("ema", ChartPointDataType.FLOAT, "scatter", "red"),
+            ChartSchema("sma", ChartPointDataType.FLOAT, "scatter", "red"),
+        ]
+    )
+    # in time order with repeated timestamps, converted without sorting
+    strategy_monitor._chart_points.clear()
+    for ts, ema, sma in [(1, 1, 4), (2, 2, 5), (3, 3, 6)]:
+        chart("ema", ema, ts)
+        chart("sma", sma, ts)
+    in_order = strategy_monitor.convert_chart_data(strategy_monitor._chart_points)
+
+    # the same points out of order go through the sort
+    strategy_monitor._chart_points.clear()
+    for ts, ema, sma in [(3, 3, 6), (1, 1, 4), (2, 2, 5)]:
+        chart("sma", sma, ts)
+        chart("ema", ema, ts)
+    shuffled = strategy_monitor.convert_chart_data(strategy_monitor._chart_points)
+    strategy_monitor._chart_points.clear()
+
+    assert in_order["data"] == {1: [1, 4], 2: [2, 5], 3: [3, 6]}
+    assert list(in_order["data"]) == [1, 2, 3]
+    assert in_order == shuffled
+
+
 def test_exception():
     try:
         raise ValueError("I am an error")
@@ -133,11 +160,9 @@ def test_order():
 
 
 async def create_dummy_order(exchange):
-    order_closed_fut = asyncio.Future()
     update_mark_ts("BTC/USDT", get_now_ts(), 12)
     order1 = await exchange.open("BTC/USDT", PositionType.LONG, 1, OrderType.LIMIT, 12)
-    order1.on("CLOSED", lambda _: order_closed_fut.set_result(None))
-    await order_closed_fut
+    await order1
 
 
 @pytest.mark.asyncio
@@ -147,11 +172,10 @@ async def test_scheduled_run():
     exchange = PaperExchange()
     await exchange.start()
 
-    await create_dummy_order(exchange)
-    await create_dummy_order(exchange)
-    await create_dummy_order(exchange)
+    await asyncio.gather(*(create_dummy_order(exchange) for _ in range(3)))
 
-    strategy_monitor.set_upload_interval(2)
+    # the interval is in seconds, a short one keeps the scheduled upload path without waiting on it
+    strategy_monitor.set_upload_interval(0.1)
     strategy_monitor.on("upload_complete", lambda: upload_complete_fut.set_result(None))
 
     await strategy_monitor.start()
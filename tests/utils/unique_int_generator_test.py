@@ -0,0 +1,9 @@
+from superalgorithm.utils.unique_int_generator import unique_int_generator
+
+
+def test_generate_client_id_is_unique_and_increasing():
+    # many ids within the same millisecond must neither repeat nor stall the generator
+    ids = [unique_int_generator.generate_client_id() for _ in range(50000)]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)